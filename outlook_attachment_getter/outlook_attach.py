@@ -1,18 +1,99 @@
 import win32com.client
+import pythoncom
+import pywintypes
 import pandas as pd
+import openpyxl
 import zipfile
+import mmap
+import io
+import re
+import importlib.util
+import os
+import shutil
+import tempfile
 import datetime as dt
+import time
 import warnings
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+#DASL property name of an email's "has attachments" flag, usable as an Outlook Table column
+HAS_ATTACHMENT = "urn:schemas:httpmail:hasattachment"
+
+#MAPI property tag of an attachment's binary content (PR_ATTACH_DATA_BIN)
+ATTACH_DATA_BIN = "http://schemas.microsoft.com/mapi/proptag/0x37010102"
+
+
+#Rust-based calamine excel engine can be used (pandas >= 2.2 with python-calamine installed)
+CALAMINE_AVAILABLE = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2]) >= (2, 2) and importlib.util.find_spec('python_calamine') is not None
+
+#Per-thread record of whether COM has been initialized by this module
+_com_thread = threading.local()
+
+
+class _zip_mmap(mmap.mmap):
+    '''Read-only memory map usable as a zipfile source (mmap only reports itself seekable from Python 3.13)'''
+
+    def seekable(self):
+
+        return True
+
+
+class _advanced_search_events():
+    '''Outlook Application event sink, recording tags of completed AdvancedSearch calls'''
+
+    completed_tags = None
+
+    def OnAdvancedSearchComplete(self, SearchObject):
+
+        self.completed_tags.add(SearchObject.Tag)
 
 
 class outlook_attachment():
-    '''Class representing an outlook email attachment getter'''
+    '''
+    Class representing an outlook email attachment getter.
+    Not thread-safe: the Outlook connection belongs to the thread that first used it, so use one object per thread (as get_attachments_bulk does).
+    '''
 
-    def __init__(self):
+    def __init__(self, max_total_bytes: int = 2 << 30, max_members: int = 10_000, max_ratio: float = 100):
+        '''
+        @param max_total_bytes: (optional) largest total decompressed size of a zip file that extract_zip_content will unzip
+        @param max_members: (optional) largest number of members of a zip file that extract_zip_content will unzip
+        @param max_ratio: (optional) largest decompressed-to-compressed size ratio of any zip member that extract_zip_content will unzip
+        '''
 
         self.attachment_filepath = None
         self.df = None
 
+        #Zip bomb limits
+        self.max_total_bytes = max_total_bytes
+        self.max_members = max_members
+        self.max_ratio = max_ratio
+
+        #Outlook MAPI namespace, connected on first use (see _ns_lazy)
+        self._ns = None
+
+        #(EntryID, StoreID) of resolved folders, keyed by folder path
+        self._folder_cache = {}
+
+
+    def _ns_lazy(self):
+        '''
+        Gets Outlook MAPI namespace, connecting to Outlook (early-bound COM object) on first call and reusing the connection afterwards.
+        Initializes COM (single-threaded apartment) on the calling thread if it has not been already.
+        @return ns: Outlook MAPI namespace
+        '''
+
+        if self._ns is None:
+            if not getattr(_com_thread, 'initialized', False):
+                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+                _com_thread.initialized = True
+            self._ns = win32com.client.gencache.EnsureDispatch("Outlook.Application").GetNamespace("MAPI")
+
+        return self._ns
+
 
     def get_today_interval(self):
         '''
@@ -29,17 +110,38 @@ class outlook_attachment():
         return start, end
 
 
-    def get_attachment(self, folderpath_list: list, email_subject_name: str, email_attachment_name: str, start_interval=None, end_interval=None, save_attachment_as=None):
+    def _iter_items(self, items):
         '''
-        Gets attachment from Outlook email within time interval from specified folder. Writes attachment to disk if valid filepath is input; otherwise, returns attachment as a 'win32com.client.CDispatch' object.
-        If multiple emails match the query criteria, the most recent email + attachment will be chosen.
-        @param folderpath_list: sequential list of subfolders, from highest folder to lowest subfolder (e.g. ['level_1', 'level_2'])
-        @param email_subject_name: subject of desired email
-        @param email_attachment_name: name of attachment on desired email
-        @param start_interval: (optional) datetime object declaring left bound of email received time interval. *The start interval is included* (>=). Needs to include year, month day, hour, minute, and second.
-        @param end_interval: (optional) datetime object declaring right bound of email received time interval. *The end interval is included* (<=). Needs to include year, month day, hour, minute, and second.
-        @param save_attachment_as: (optional) filepath (path, file name, and file type must be included) where the attachment will be saved (e.g. "r\\network\attachment.xlsx")
-        @return attachment: email attachment returned (if save_attachment_as is None)
+        Streams items from an Outlook Items collection one at a time (GetFirst/GetNext), in the collection's sort order.
+        Stopping iteration early avoids fetching the remaining items.
+        @param items: Outlook Items collection
+        @return item: generator of items
+        '''
+
+        item = items.GetFirst()
+        while item is not None:
+            yield item
+            item = items.GetNext()
+
+
+    def _iter_table_items(self, table, store_id):
+        '''
+        Streams emails with attachments from an Outlook Table, in the table's sort order. Only those emails are opened as full items.
+        @param table: Outlook Table with EntryID and HAS_ATTACHMENT columns
+        @param store_id: StoreID of the folder the table was read from
+        @return email: generator of emails
+        '''
+
+        while not table.EndOfTable:
+            row = table.GetNextRow()
+            if row.Item(HAS_ATTACHMENT):
+                #Look item up in the folder's own store (which may not be the default store)
+                yield self._ns_lazy().GetItemFromID(row.Item("EntryID"), store_id)
+
+
+    def _check_query(self, folderpath_list, email_subject_name, email_attachment_name, start_interval, end_interval, save_attachment_as):
+        '''
+        Checks get_attachment query parameters (see get_attachment), raising if any is invalid
         '''
 
         #Type checking
@@ -48,81 +150,310 @@ class outlook_attachment():
         assert(isinstance(email_attachment_name, str)), f'''email_attachment_name must be of type string. You input an object of type {type(email_attachment_name)}.'''
         if save_attachment_as is not None:
             assert(isinstance(save_attachment_as, str)), f'''save_attachment_as must be of type string. You input an object of type {type(save_attachment_as)}.'''
-            #Ensure filepath is given (not just desired file name)
-            if not (("\\" in save_attachment_as) or ("/" in save_attachment_as)):
-                raise Exception(f'''Parameter save_attachment_as requires a full path. The method will not default to the current working directory.''')
+            #Ensure full filepath is given (not just desired file name, or a relative path)
+            if not os.path.isabs(save_attachment_as):
+                raise ValueError(f'''Parameter save_attachment_as requires a full path. The method will not default to the current working directory.''')
+
+        if start_interval is not None:
+            assert(isinstance(start_interval, dt.datetime)), f'''start_interval must be of type datetime.datetime. You input an object of type {type(start_interval)}.'''
+        if end_interval is not None:
+            assert(isinstance(end_interval, dt.datetime)), f'''end_interval must be of type datetime.datetime. You input an object of type {type(end_interval)}.'''
 
         #Ensure start is <= end
         if (start_interval is not None) and (end_interval is not None):
             if start_interval > end_interval:
                 raise Exception(f'''Start of interval {start_interval.strftime("%m/%d/%Y %H:%M %p")} is more recent than end of interval {end_interval.strftime("%m/%d/%Y %H:%M %p")}. Start of interval must come before or at the same time as end of interval.''')
 
-        print(f'''Start interval email query: {start_interval.strftime("%m/%d/%Y %I:%M %p")}\n\n''')
-        print(f'''End interval email query: {end_interval.strftime("%m/%d/%Y %I:%M %p")}\n\n''')
 
-        #Interface with Microsoft Outlook (using IDispatch-based COM object)
-        Outlook = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+    def _get_folder(self, folderpath_list: list):
+        '''
+        Gets Outlook Folder object from folder path. Resolved folders are cached by EntryID and StoreID.
+        @param folderpath_list: sequential list of subfolders, from highest folder to lowest subfolder (e.g. ['level_1', 'level_2'])
+        @return Folder: Outlook Folder object
+        '''
+
+        Outlook = self._ns_lazy()
+
+        folder_key = tuple(folderpath_list)
+        if folder_key in self._folder_cache:
+            #Look folder up directly in its store, rather than walking the folder path again
+            Folder = Outlook.GetFolderFromID(*self._folder_cache[folder_key])
+        else:
+            for i, folder in enumerate(folderpath_list):
 
-        #Create Folder object for folder that contains desired email & attachment
-        for i, folder in enumerate(folderpath_list):
+                if i==0:
+                    Folder = Outlook.Folders[folder]
+                else:
+                    Folder = Folder.Folders[folder]
 
-            if i==0:
-                Folder = Outlook.Folders[folder]
+            self._folder_cache[folder_key] = (Folder.EntryID, Folder.StoreID)
+
+        return Folder
+
+
+    def _get_matching_attachment(self, candidate_emails, email_subject_name: str, email_attachment_name: str, save_attachment_as=None):
+        '''
+        Gets first attachment named email_attachment_name from candidate emails, saving it to disk if save_attachment_as is given
+        @param candidate_emails: iterable of emails with attachments matching the query, most recent first
+        @param email_subject_name: subject of desired email (used in error message)
+        @param email_attachment_name: name of attachment on desired email
+        @param save_attachment_as: (optional) filepath where the attachment will be saved
+        @return attachment: email attachment returned (if save_attachment_as is None)
+        '''
+
+        #Get most recent email+attachment that meets criteria
+        for email in candidate_emails:
+
+            #Stop at first attachment with matching name
+            attachment = next((a for a in email.Attachments if a.FileName == email_attachment_name), None)
+            if attachment is None:
+                continue
+
+            if save_attachment_as is not None:
+                try:
+                    #Ensure folder exists, so saving does not fail on a missing path
+                    os.makedirs(os.path.dirname(save_attachment_as), exist_ok=True)
+                    attachment.SaveAsFile(save_attachment_as)
+                except (pywintypes.com_error, OSError) as e:
+                    raise RuntimeError(f'''Attachment was not saved as {save_attachment_as}.''') from e
+                print(f'''Most recent email attachment that meets criteria has been saved as {save_attachment_as}\n\n''')
+                self.attachment_filepath = save_attachment_as
+                return None
             else:
-                Folder = Folder.Folders[folder]
+                return attachment
+
+        raise Exception(f'''Could not find email {email_subject_name} with attachment {email_attachment_name} within (un)specified time interval.''')
 
-        #Get emails from folder
-        emails = Folder.Items
+
+    def get_attachment(self, folderpath_list: list, email_subject_name: str, email_attachment_name: str, start_interval=None, end_interval=None, save_attachment_as=None):
+        '''
+        Gets attachment from Outlook email within time interval from specified folder. Writes attachment to disk if valid filepath is input; otherwise, returns attachment as a 'win32com.client.CDispatch' object.
+        If multiple emails match the query criteria, the most recent email + attachment will be chosen.
+        @param folderpath_list: sequential list of subfolders, from highest folder to lowest subfolder (e.g. ['level_1', 'level_2'])
+        @param email_subject_name: subject of desired email
+        @param email_attachment_name: name of attachment on desired email
+        @param start_interval: (optional) datetime object declaring left bound of email received time interval. *The start interval is included* (>=). Needs to include year, month day, hour, minute, and second.
+        @param end_interval: (optional) datetime object declaring right bound of email received time interval. *The end interval is included* (<=). Needs to include year, month day, hour, minute, and second.
+        @param save_attachment_as: (optional) filepath (path, file name, and file type must be included) where the attachment will be saved (e.g. "r\\network\attachment.xlsx")
+        @return attachment: email attachment returned (if save_attachment_as is None)
+        '''
+
+        self._check_query(folderpath_list, email_subject_name, email_attachment_name, start_interval, end_interval, save_attachment_as)
+
+        if start_interval is not None:
+            print(f'''Start interval email query: {start_interval.strftime("%m/%d/%Y %I:%M %p")}\n\n''')
+        if end_interval is not None:
+            print(f'''End interval email query: {end_interval.strftime("%m/%d/%Y %I:%M %p")}\n\n''')
+
+        #Create Folder object for folder that contains desired email & attachment
+        Folder = self._get_folder(folderpath_list)
+
+        #Received time bounds
+        time_filters = []
 
         #Restrict emails to after or equal to start interval
         if start_interval is not None:
-            assert(isinstance(start_interval, dt.datetime)), f'''start_interval must be of type datetime.datetime. You input an object of type {type(start_interval)}.'''
-            emails = emails.Restrict("[ReceivedTime] >= '" + start_interval.strftime('%m/%d/%Y %H:%M %p') + "'")
+            time_filters.append("[ReceivedTime] >= '" + start_interval.strftime('%m/%d/%Y %H:%M %p') + "'")
 
         #Restrict emails to before or equal to end interval
         if end_interval is not None:
-            assert(isinstance(end_interval, dt.datetime)), f'''end_interval must be of type datetime.datetime. You input an object of type {type(end_interval)}.'''
-            emails = emails.Restrict("[ReceivedTime] <= '" + end_interval.strftime('%m/%d/%Y %H:%M %p') + "'")
+            time_filters.append("[ReceivedTime] <= '" + end_interval.strftime('%m/%d/%Y %H:%M %p') + "'")
+
+        #Restrict emails to matching subject (single quotes escaped for the filter)
+        subject_filter = "[Subject] = '" + email_subject_name.replace("'", "''") + "'"
+
+        #Get matching emails as table rows, so items are only opened when they have attachments
+        table = Folder.GetTable(" AND ".join([subject_filter] + time_filters))
+        table.Columns.RemoveAll()
+        table.Columns.Add("EntryID")
+        table.Columns.Add("ReceivedTime")
+        table.Columns.Add(HAS_ATTACHMENT)
 
         #Sort emails, descending order
-        emails.Sort("[ReceivedTime]", True)
+        table.Sort("[ReceivedTime]", True)
 
-        #Preset email as not found
-        found_attachment = False
-        #Get most recent email+attachment that meets criteria
-        for email in emails:
+        #An empty table means no email matches, so the not-found error is raised without scanning the folder
+        candidate_emails = self._iter_table_items(table, Folder.StoreID)
+
+        return self._get_matching_attachment(candidate_emails, email_subject_name, email_attachment_name, save_attachment_as)
+
+
+    def get_attachment_bytes(self, folderpath_list: list, email_subject_name: str, email_attachment_name: str, start_interval=None, end_interval=None):
+        '''
+        Gets attachment from Outlook email (see get_attachment) as an in-memory file, read directly from MAPI where possible (otherwise via a temporary file). The result can be passed to extract_zip_content.
+        @param folderpath_list: sequential list of subfolders, from highest folder to lowest subfolder (e.g. ['level_1', 'level_2'])
+        @param email_subject_name: subject of desired email
+        @param email_attachment_name: name of attachment on desired email
+        @param start_interval: (optional) datetime object declaring left bound of email received time interval (>=)
+        @param end_interval: (optional) datetime object declaring right bound of email received time interval (<=)
+        @return attachment_bytes: attachment content as io.BytesIO
+        '''
+
+        attachment = self.get_attachment(folderpath_list=folderpath_list,
+                                         email_subject_name=email_subject_name,
+                                         email_attachment_name=email_attachment_name,
+                                         start_interval=start_interval,
+                                         end_interval=end_interval)
+
+        try:
+            #Read attachment content straight from MAPI
+            return io.BytesIO(bytes(attachment.PropertyAccessor.GetProperty(ATTACH_DATA_BIN)))
+        except pywintypes.com_error:
+            #PropertyAccessor refuses large binary values (notably on online-mode Exchange stores), so save to a temporary file and read it back
+            with tempfile.TemporaryDirectory() as temp_folder:
+                temp_filepath = os.path.join(temp_folder, os.path.basename(email_attachment_name) or 'attachment')
+                attachment.SaveAsFile(temp_filepath)
+                with open(temp_filepath, 'rb') as temp_file:
+                    return io.BytesIO(temp_file.read())
+
+
+    def get_attachment_async(self, folderpath_list: list, email_subject_name: str, email_attachment_name: str, start_interval=None, end_interval=None, save_attachment_as=None, search_subfolders: bool = True, timeout: float = 60):
+        '''
+        Gets attachment from Outlook email (see get_attachment) using Outlook's AdvancedSearch, which runs the search in the store (using its indexes) and signals when it is complete. Can search subfolders of the specified folder as well.
+        @param folderpath_list: sequential list of subfolders, from highest folder to lowest subfolder (e.g. ['level_1', 'level_2'])
+        @param email_subject_name: subject of desired email
+        @param email_attachment_name: name of attachment on desired email
+        @param start_interval: (optional) datetime object declaring left bound of email received time interval (>=)
+        @param end_interval: (optional) datetime object declaring right bound of email received time interval (<=)
+        @param save_attachment_as: (optional) filepath (path, file name, and file type must be included) where the attachment will be saved
+        @param search_subfolders: (optional) If True, subfolders of the specified folder are searched as well
+        @param timeout: (optional) seconds to wait for the search to complete
+        @return attachment: email attachment returned (if save_attachment_as is None)
+        '''
+
+        self._check_query(folderpath_list, email_subject_name, email_attachment_name, start_interval, end_interval, save_attachment_as)
+        assert(isinstance(search_subfolders, bool)), f'''search_subfolders must be of type bool. You input an object of type {type(search_subfolders)}.'''
+
+        Folder = self._get_folder(folderpath_list)
+
+        #DASL filter (single quotes escaped); DASL compares dates in UTC
+        dasl_filters = ["\"urn:schemas:httpmail:subject\" = '" + email_subject_name.replace("'", "''") + "'"]
+        if start_interval is not None:
+            dasl_filters.append("\"urn:schemas:httpmail:datereceived\" >= '" + start_interval.astimezone(dt.timezone.utc).strftime('%m/%d/%Y %I:%M %p') + "'")
+        if end_interval is not None:
+            dasl_filters.append("\"urn:schemas:httpmail:datereceived\" <= '" + end_interval.astimezone(dt.timezone.utc).strftime('%m/%d/%Y %I:%M %p') + "'")
+
+        #Listen for search completion on the Outlook Application
+        Application = self._ns_lazy().Application
+        events = win32com.client.WithEvents(Application, _advanced_search_events)
+        events.completed_tags = set()
+
+        try:
+            #Search scope is the quoted folder path (single quotes escaped)
+            tag = f'''outlook_attachment_getter_{id(self)}_{time.monotonic_ns()}'''
+            search = Application.AdvancedSearch("'" + Folder.FolderPath.replace("'", "''") + "'", " AND ".join(dasl_filters), search_subfolders, tag)
+
+            #Wait for search to complete, pumping COM messages so the completion event is delivered
+            deadline = time.monotonic() + timeout
+            while tag not in events.completed_tags:
+                if time.monotonic() > deadline:
+                    search.Stop()
+                    raise Exception(f'''Search for email {email_subject_name} did not complete within {timeout} seconds.''')
+                pythoncom.PumpWaitingMessages()
+                time.sleep(0.05)
+        finally:
+            #Disconnect event sink, so it does not keep receiving later searches' events
+            events.close()
+
+        #Sort emails, descending order
+        results = search.Results
+        results.Sort("[ReceivedTime]", True)
+
+        #Skip fetching attachments of emails without any
+        candidate_emails = (email for email in self._iter_items(results) if email.HasAttachments)
 
-            if email.Subject == email_subject_name:
+        return self._get_matching_attachment(candidate_emails, email_subject_name, email_attachment_name, save_attachment_as)
 
-                for attachment in email.Attachments:
 
-                    if attachment.FileName == email_attachment_name:
+    def _init_bulk_worker(self):
+        '''
+        Sets up a get_attachments_bulk worker thread: initializes COM (single-threaded apartment) once for the thread's lifetime.
+        '''
+
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        _com_thread.initialized = True
+        _com_thread.getter = None
+
+
+    def _teardown_bulk_worker(self, barrier: threading.Barrier):
+        '''
+        Tears down a get_attachments_bulk worker thread: releases its getter (and Outlook connection), then uninitializes COM.
+        @param barrier: barrier shared by one teardown per worker thread; waiting on it ensures each thread runs exactly one teardown
+        '''
+
+        barrier.wait()
+        #Release COM objects before leaving the apartment
+        _com_thread.getter = None
+        _com_thread.initialized = False
+        pythoncom.CoUninitialize()
+
+
+    def _get_attachment_worker(self, query: dict):
+        '''
+        Runs a single get_attachment query on a get_attachments_bulk worker thread, reusing the thread's own Outlook connection.
+        @param query: keyword arguments for get_attachment
+        @return attachment_filepath: filepath the attachment was saved as
+        '''
+
+        #COM objects cannot be shared across threads, so each worker thread keeps its own getter (and Outlook namespace and folder cache) across queries
+        if _com_thread.getter is None:
+            _com_thread.getter = outlook_attachment()
+        getter = _com_thread.getter
+        getter.attachment_filepath = None
+
+        error = None
+        try:
+            getter.get_attachment(**query)
+            return getter.attachment_filepath
+        except Exception as e:
+            #Keep the original traceback as text, and its type and arguments (e.g. com_error hresult), rather than the exception itself: the traceback's frames hold COM objects of this thread's apartment
+            error = RuntimeError(f'''Query for email {query.get('email_subject_name')} failed.\n\n{traceback.format_exc()}''')
+            error.original_type = type(e)
+            error.original_args = e.args
+
+        #Raised outside the except block, so the original exception (and its frames) is released on this thread
+        raise error
 
-                        found_attachment = True
-                        if save_attachment_as is not None:
-                            try:
-                                attachment.SaveAsFile(save_attachment_as)
-                                print(f'''Most recent email attachment that meets criteria has been saved as {save_attachment_as}\n\n''')
-                                self.attachment_filepath = save_attachment_as
-                                return None
-                            except:
-                                raise Exception(f'''Attachment was not saved. Please refer to Python error.''')
-                        else:
-                            try:
-                                return attachment
-                            except:
-                                raise Exception(f'''Attachment was not returned. Please refer to Python error.''')
 
-        if found_attachment is False:
-            raise Exception(f'''Could not find email {email_subject_name} with attachment {email_attachment_name} within (un)specified time interval.''')
+    def get_attachments_bulk(self, queries: list):
+        '''
+        Gets several attachments concurrently, on up to 8 worker threads. Each thread connects to Outlook once and reuses the connection for its queries. Each attachment is written to disk.
+        @param queries: list of dicts, each holding the keyword arguments of get_attachment (e.g. {'folderpath_list': ['level_1', 'level_2'], 'email_subject_name': 'email subject', 'email_attachment_name': 'attachment.zip', 'save_attachment_as': 'C:\\user\\test\\test_attachment.zip'}). save_attachment_as is required, as COM attachment objects cannot be returned across threads.
+        @return attachment_filepaths: list of filepaths the attachments were saved as, in the same order as queries
+        '''
+
+        #Type checking
+        assert(isinstance(queries, list)), f'''queries must be of type list. You input an object of type {type(queries)}.'''
+        for query in queries:
+            assert(isinstance(query, dict)), f'''Each query must be of type dict. You input an object of type {type(query)}.'''
+            assert(query.get('save_attachment_as') is not None), f'''Each query must include save_attachment_as.'''
+
+        if len(queries) == 0:
+            return []
+
+        #Generate early-bound Outlook wrappers (gen_py cache) once on this thread, so workers do not race to write them
+        self._ns_lazy()
+
+        max_workers = min(8, len(queries))
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=self._init_bulk_worker) as executor:
+            try:
+                attachment_filepaths = list(executor.map(self._get_attachment_worker, queries))
+            finally:
+                #Run one teardown on every worker thread, once all queries are done
+                barrier = threading.Barrier(max_workers)
+                for _ in range(max_workers):
+                    executor.submit(self._teardown_bulk_worker, barrier)
+
+        return attachment_filepaths
 
 
     def extract_zip_content(self, filepath, extract_file_name: str, save_unzipped_folder: str, exact: bool = False):
         '''
         Unzips zip file
+        @param filepath: filepath of zip file, or file-like object holding it (e.g. returned by get_attachment_bytes)
         @param extract_file_name: file (file name, and file type must be included) to be extracted from zip
         @param save_unzipped_folder: folderpath (entire folderpath (do NOT include file name or type) must be included) where the unzipped attachment will be saved (e.g. "r\\user\folder")
-        @param exact: If False, will extract file from zip that has extract_file_name in its name. If True, will only extract file from zip with exact string as extract_file_name.
+        @param exact: If False, will extract the first file from zip that has extract_file_name in its name. If True, will only extract file from zip with exact string as extract_file_name.
         '''
 
         #type checking
@@ -133,43 +464,111 @@ class outlook_attachment():
         if not (zipfile.is_zipfile(filepath)):
             print(f'''{filepath} is not a zip file; therefore it cannot be unzipped.''')
         else:
-            #Create zipfile object with positions zip
-            zip_file = zipfile.ZipFile(filepath)
-
-            #Save specified file within zip
-            file_found = False
-            for file_name in zip_file.namelist():
-
-                if exact is True:
-
-                    if extract_file_name == file_name:
-
-                        zip_file.extract(file_name, save_unzipped_folder)
-                        filepath = str(save_unzipped_folder) + "\\" + file_name
-                        file_found = True
+            zip_fh = None
+            zip_map = None
+            try:
+                if isinstance(filepath, (str, os.PathLike)):
+                    #Memory-map zip file, so the central directory and members are read as memory rather than via many small reads
+                    zip_fh = open(filepath, 'rb')
+                    zip_map = _zip_mmap(zip_fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    zip_source = zip_map
+                else:
+                    zip_source = filepath
+
+                #Create zipfile object with positions zip
+                with zipfile.ZipFile(zip_source) as zip_file:
+
+                    #Guard against zip bombs using header information only, before anything is decompressed
+                    infos = zip_file.infolist()
+                    if len(infos) > self.max_members:
+                        raise Exception(f'''{filepath} has {len(infos)} members, more than the limit of {self.max_members}. It will not be unzipped.''')
+                    total_bytes = sum(info.file_size for info in infos)
+                    if total_bytes > self.max_total_bytes:
+                        raise Exception(f'''{filepath} decompresses to {total_bytes} bytes, more than the limit of {self.max_total_bytes}. It will not be unzipped.''')
+                    for info in infos:
+                        if info.file_size / max(info.compress_size, 1) > self.max_ratio:
+                            raise Exception(f'''{info.filename} in {filepath} has a compression ratio above the limit of {self.max_ratio}:1. It will not be unzipped.''')
+
+                    #Match member names exactly, or by substring
+                    if exact is True:
+                        match = lambda file_name: file_name == extract_file_name
+                    else:
+                        match = re.compile(re.escape(extract_file_name)).search
+
+                    #Find first matching file within zip (directory entries hold no file content)
+                    info = next((info for info in infos if not info.is_dir() and match(info.filename)), None)
+
+                    if info is None:
+                        print(f'''Could not find file {extract_file_name} in zipfile.''')
+                    else:
+                        #Stream member to disk in 1 MB chunks
+                        os.makedirs(save_unzipped_folder, exist_ok=True)
+                        filepath = os.path.join(save_unzipped_folder, os.path.basename(info.filename))
+                        with zip_file.open(info) as src, open(filepath, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, 1 << 20)
                         print(f'''Unzipped attachment saved as {filepath}''')
+            finally:
+                if zip_map is not None:
+                    zip_map.close()
+                if zip_fh is not None:
+                    zip_fh.close()
 
-                elif exact is False:
-
-                    if extract_file_name in file_name:
 
-                        zip_file.extract(file_name, save_unzipped_folder)
-                        filepath = str(save_unzipped_folder) + "\\" + file_name
-
-                        file_found = True
-                        print(f'''Unzipped attachment saved as {filepath}''')
+    def set_df(self):
+        '''Will read excel file to pandas dataframe'''
 
-            if file_found is False:
-                print(f'''Could not find file {file_name} in zipfile.''')
+        #Both engines read the first sheet
+        if CALAMINE_AVAILABLE:
+            self.df = pd.read_excel(self.attachment_filepath, sheet_name=0, engine='calamine')
+        else:
+            self.df = self._read_excel_openpyxl(self.attachment_filepath)
 
 
-    def set_df(self):
-        '''Will read excel file to pandas dataframe'''
+    def _read_excel_openpyxl(self, filepath):
+        '''
+        Reads first sheet of excel file to pandas dataframe with openpyxl, first row as header (as pd.read_excel does)
+        @param filepath: filepath of excel file
+        @return df: pandas dataframe
+        '''
 
+        #Read-only workbook streams cell values without building styles or formulas
         #Used to rid warning: "Workbook contains no default style, apply openpyxl's default"
         with warnings.catch_warnings(record=True):
             warnings.simplefilter("always")
-            self.df = pd.read_excel(self.attachment_filepath, engine='openpyxl')
+            wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            #Ignore the sheet's stored dimension, which report generators often write stale (e.g. "A1")
+            ws.reset_dimensions()
+            rows = [list(row) for row in ws.iter_rows(values_only=True)]
+        finally:
+            wb.close()
+
+        #Drop trailing empty rows (read-only mode yields formatted but empty cells)
+        while rows and all(value is None for value in rows[-1]):
+            rows.pop()
+
+        if not rows:
+            return pd.DataFrame()
+
+        #Trim trailing empty cells, then pad ragged rows to the widest row
+        width = max(max((i + 1 for i, value in enumerate(row) if value is not None), default=0) for row in rows)
+        rows = [row[:width] + [None] * (width - len(row)) for row in rows]
+
+        #Name blank (or missing) headers and de-duplicate repeated ones, as pd.read_excel does
+        header = []
+        header_counts = {}
+        for i, name in enumerate(rows[0]):
+            if name is None:
+                name = f'''Unnamed: {i}'''
+            if name in header_counts:
+                header_counts[name] += 1
+                name = f'''{name}.{header_counts[name]}'''
+            else:
+                header_counts[name] = 0
+            header.append(name)
+
+        return pd.DataFrame(rows[1:], columns=header)
 
 
     def df_getter(self):
@@ -208,3 +607,10 @@ if __name__ == "__main__":
                           end_interval=end_interval,
                           save_attachment_as=r'C:\user\test\test_attachment.zip')
 
+    #Alternatively, get zip attachment in memory and unzip it without saving the zip to disk
+    #attachment_bytes = getter.get_attachment_bytes(folderpath_list=['level_1', 'level_2'],
+    #                                               email_subject_name='email subject',
+    #                                               email_attachment_name='attachment.zip',
+    #                                               start_interval=start_interval,
+    #                                               end_interval=end_interval)
+    #getter.extract_zip_content(attachment_bytes, extract_file_name='attachment.xlsx', save_unzipped_folder=r'C:\user\test')